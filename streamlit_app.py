@@ -1,3 +1,4 @@
+import pandas as pd
 import streamlit as st
 from datetime import datetime
 
@@ -5,14 +6,15 @@ st.set_page_config(page_title="Physician Meeting Scheduler", page_icon="🩺", l
 
 # Simple in-memory storage (resets on reload)
 if "meetings" not in st.session_state:
-    st.session_state["meetings"] = []
+    st.session_state["meetings"] = pd.DataFrame(columns=["physician", "patient", "datetime", "link"])
 
 st.title("🩺 Physician–Patient Meeting Scheduler")
 
 tabs = st.tabs(["Physician", "Patient"])
 
 # ------------------- Physician tab -------------------
-with tabs[0]:
+@st.fragment
+def physician_panel():
     st.header("👩‍⚕️ Add a new meeting")
     with st.form("add_meeting"):
         physician = st.text_input("Physician Name")
@@ -24,16 +26,16 @@ with tabs[0]:
         
         if submitted:
             if physician and patient and link:
-                st.session_state["meetings"].append({
-                    "physician": physician,
-                    "patient": patient,
-                    "datetime": datetime.combine(date, time),
-                    "link": link
-                })
+                meetings = st.session_state["meetings"]
+                meetings.loc[len(meetings)] = [physician, patient, datetime.combine(date, time), link]
                 st.success("✅ Meeting saved!")
             else:
                 st.error("Please fill all required fields.")
 
-    if st.session_state["meetings"]:
+    if not st.session_state["meetings"].empty:
         st.subheader("All Scheduled Meetings")
-        [for] m in st.session_state["meetings"]:
+        st.dataframe(st.session_state["meetings"].sort_values("datetime"), hide_index=True)
+
+
+with tabs[0]:
+    physician_panel()